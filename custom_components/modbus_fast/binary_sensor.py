@@ -5,75 +5,90 @@ from typing import Any, Optional
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorEntityDescription
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, SIGNAL_UPDATE
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map register type to letter per request
+TYPE_LETTERS = {
+    "holding": "H",
+    "input": "R",
+    "coil": "C",
+    "discrete": "I",
+}
+
 async def async_setup_platform(hass: HomeAssistant, config: dict, add_entities, discovery_info=None) -> None:
     hub = hass.data[DOMAIN]
     entities = []
     name_prefix = getattr(hub, "name", "Modbus Fast")
-    # Map register type to letter per request
-    type_letter = {
-        "holding": "H",
-        "input": "R",
-        "coil": "C",
-        "discrete": "I",
-    }.get(getattr(hub, "register_type", "holding"), "H")
-
-    for i in range(hub.count):
-        base_addr = hub.start_address + i
-        # Adjust for one-based naming if enabled
-        display_addr = base_addr + 1 if getattr(hub, "one_based_names", False) else base_addr
-        name = f"{name_prefix} {type_letter}{display_addr}"
-        entities.append(ModbusFastBinarySensor(hub, i, name))
+
+    multi_unit = len(hub.unit_ids) > 1
+
+    for unit_pos, unit_id in enumerate(hub.unit_ids):
+        # Disambiguate names only when several units share the hub
+        unit_prefix = f"{name_prefix} U{unit_id}" if multi_unit else name_prefix
+        for i, (rtype, base_addr) in enumerate(hub.points):
+            # Adjust for one-based naming if enabled
+            display_addr = base_addr + 1 if getattr(hub, "one_based_names", False) else base_addr
+            name = f"{unit_prefix} {TYPE_LETTERS[rtype]}{display_addr}"
+            entities.append(ModbusFastBinarySensor(hub, unit_pos, i, name))
     add_entities(entities)
 
 
 class ModbusFastBinarySensor(BinarySensorEntity):
     _attr_should_poll = False
 
-    def __init__(self, hub, index: int, name: str) -> None:
+    def __init__(self, hub, unit_pos: int, point: int, name: str) -> None:
         self._hub = hub
-        self._index = index
+        self._unit_pos = unit_pos
+        self._unit_id = hub.unit_ids[unit_pos]
+        # Position in the hub's values (and bit in its change bitmaps)
+        self._index = unit_pos * hub.count + point
+        # One-byte view into the hub's in-place values buffer; bounds checked once here
+        self._slot = memoryview(hub.values)[self._index : self._index + 1]
         self._attr_name = name
         # Compute unique id address respecting one_based_names
-        _base_addr = hub.start_address + index
+        _rtype, _base_addr = hub.points[point]
         _id_addr = _base_addr + 1 if getattr(hub, "one_based_names", False) else _base_addr
+        # Points of a non-default type get a letter so e.g. C0 and H0 don't collide
+        if _rtype != hub.register_type:
+            _id_addr = f"{TYPE_LETTERS[_rtype]}{_id_addr}"
         # Include port in unique_id to avoid collisions across ports
-        self._attr_unique_id = f"{DOMAIN}_{hub.host}_{hub.port}_{hub.unit_id}_{_id_addr}"
+        self._attr_unique_id = f"{DOMAIN}_{hub.host}_{hub.port}_{self._unit_id}_{_id_addr}"
         self._last_state: Optional[bool] = None
 
     async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_UPDATE, self._handle_hub_update)
-        )
+        # HA writes our current state right after this; seed the no-op check with it so
+        # the next availability flip isn't mistaken for an unchanged state
+        self._last_state = self.is_on if self.available else None
+        self.async_on_remove(self._hub.register_entity(self._index, self))
 
     @property
-    def is_on(self) -> Optional[bool]:
-        vals = self._hub.values
-        if vals is None or self._index >= len(vals):
-            return None
-        return vals[self._index]
+    def is_on(self) -> bool:
+        return bool(self._slot[0])
 
     @property
     def available(self) -> bool:
-        return bool(self._hub.connected)
+        return bool(self._hub.connected and self._hub.unit_ok[self._unit_pos])
 
     @property
     def device_info(self) -> dict[str, Any]:
         return {
-            "identifiers": {(DOMAIN, f"{self._hub.host}:{self._hub.port}:{self._hub.unit_id}")},
-            "name": self._hub.name,
+            "identifiers": {(DOMAIN, f"{self._hub.host}:{self._hub.port}:{self._unit_id}")},
+            "name": self._hub.name if len(self._hub.unit_ids) == 1 else f"{self._hub.name} U{self._unit_id}",
             "manufacturer": "Modbus Device",
-            "model": f"{self._hub.register_type}@{self._hub.start_address}+{self._hub.count}",
+            "model": ",".join(f"{rtype}@{start}+{count}" for rtype, start, count in self._hub.spans),
         }
 
     @callback
-    def _handle_hub_update(self, changed_idx: Optional[list[int]]) -> None:
-        # Only write state if ours changed (or if hub signaled a full update)
-        if changed_idx is None or self._index in changed_idx:
-            self._last_state = self.is_on
-            self.async_write_ha_state()
+    def async_handle_hub_update(self, full: bool) -> None:
+        """Called by the hub when our value or availability changed (or on every poll when ``full``)."""
+        # Same as is_on/available, inlined: this runs per changed entity every cycle.
+        # Availability is folded in so an availability flip is never skipped as a no-op.
+        hub = self._hub
+        new_state = bool(self._slot[0]) if hub.connected and hub.unit_ok[self._unit_pos] else None
+        if not full and new_state == self._last_state:
+            return
+        self._last_state = new_state
+        self.async_write_ha_state()
@@ -3,6 +3,7 @@ DOMAIN = "modbus_fast"
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_UNIT_ID = "unit_id"
+CONF_UNITS = "units"
 CONF_REGISTER_TYPE = "register_type"
 CONF_START_ADDRESS = "start_address"
 CONF_COUNT = "count"
@@ -11,6 +12,9 @@ CONF_NAME = "name"
 CONF_ONLY_ON_CHANGE = "only_on_change"
 CONF_TIMEOUT = "timeout"
 CONF_ONE_BASED_NAMES = "one_based_names"
+CONF_COALESCE_MS = "coalesce_ms"
+CONF_POINTS = "points"
+CONF_ADDRESS = "address"
 
 DEFAULT_PORT = 502
 DEFAULT_UNIT_ID = 1
@@ -23,5 +27,13 @@ DEFAULT_NAME = "Modbus Fast"
 DEFAULT_ONLY_ON_CHANGE = True
 DEFAULT_TIMEOUT = 1.0
 DEFAULT_ONE_BASED_NAMES = False
+DEFAULT_COALESCE_MS = 0
 
-SIGNAL_UPDATE = f"{DOMAIN}_update"
+# Modbus protocol limits for a single read request
+MAX_REGISTERS_PER_READ = 125
+MAX_BITS_PER_READ = 2000
+
+# Reconnect backoff (seconds): doubles per failed attempt, randomized by +/- jitter
+RECONNECT_MIN_DELAY = 0.1
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_JITTER = 0.15
@@ -7,14 +7,25 @@ Examples:
 - TCP holding registers:  python scripts/modbus_test.py --host 192.168.1.10 --type holding --address 0 --count 2 --unit 1
 - TCP coils:              python scripts/modbus_test.py --host 192.168.1.10 --type coils --address 0 --count 8 --unit 1
 - RTU holding registers:  python scripts/modbus_test.py --mode rtu --serial COM3 --baud 9600 --type holding --address 0 --count 2 --unit 1
+- Steady-state latency:   python scripts/modbus_test.py --host 192.168.1.10 --type discrete --count 32 --repeat 200
+- Queued reads:           python scripts/modbus_test.py --host 192.168.1.10 --type holding --count 8 --repeat 50 --concurrent 4
+
+All reads reuse one connection, like one unit in the integration's poll loop. pymodbus sends
+the --concurrent reads of a batch one after another on it, the way a unit's spans are read.
+With --repeat/--concurrent the per-batch latency (min/max/mean) is printed, which helps pick
+a realistic sample_period_ms.
+uvloop is used when installed (disable with --no-uvloop).
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
+import statistics
 import sys
+import time
 
 try:
-    from pymodbus.client import ModbusTcpClient, ModbusSerialClient
+    from pymodbus.client import AsyncModbusTcpClient, AsyncModbusSerialClient
 except Exception as e:  # pragma: no cover
     print("pymodbus is required. Install it with: pip install pymodbus", file=sys.stderr)
     raise
@@ -27,6 +38,13 @@ def positive_int(value: str) -> int:
     return ivalue
 
 
+def at_least_one(value: str) -> int:
+    ivalue = int(value)
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return ivalue
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Read values from a Modbus device")
     p.add_argument("--mode", choices=["tcp", "rtu"], default="tcp", help="Connection mode")
@@ -49,19 +67,33 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--unit", type=int, default=1, help="Modbus unit/device id (default: 1)")
     p.add_argument("--timeout", type=float, default=3.0, help="Socket/serial timeout in seconds (default: 3.0)")
 
+    # Steady-state timing
+    p.add_argument("--repeat", type=at_least_one, default=1, help="Read batches to run on one connection (default: 1)")
+    p.add_argument("--concurrent", type=at_least_one, default=1, help="Reads queued on the connection per batch (default: 1)")
+    p.add_argument("--no-uvloop", action="store_true", help="Use the default asyncio loop even if uvloop is installed")
+
     return p.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
+def read(client, args: argparse.Namespace):
+    """Start one read of the configured type; returns the awaitable response."""
+    if args.type == "holding":
+        return client.read_holding_registers(args.address, count=args.count, device_id=args.unit)
+    if args.type == "input":
+        return client.read_input_registers(args.address, count=args.count, device_id=args.unit)
+    if args.type == "coils":
+        return client.read_coils(args.address, count=args.count, device_id=args.unit)
+    return client.read_discrete_inputs(args.address, count=args.count, device_id=args.unit)
+
 
+async def run(args: argparse.Namespace) -> int:
     if args.mode == "tcp":
-        client = ModbusTcpClient(host=args.host, port=args.port, timeout=args.timeout)
+        client = AsyncModbusTcpClient(host=args.host, port=args.port, timeout=args.timeout)
     else:
         if not args.serial:
             print("--serial is required for RTU mode", file=sys.stderr)
             return 2
-        client = ModbusSerialClient(
+        client = AsyncModbusSerialClient(
             method="rtu",
             port=args.serial,
             baudrate=args.baud,
@@ -71,23 +103,21 @@ def main() -> int:
             timeout=args.timeout,
         )
 
-    if not client.connect():
+    if not await client.connect():
         print("Failed to connect to Modbus device", file=sys.stderr)
         return 3
 
     try:
-        if args.type == "holding":
-            rr = client.read_holding_registers(args.address, count=args.count, device_id=args.unit)
-        elif args.type == "input":
-            rr = client.read_input_registers(args.address, count=args.count, device_id=args.unit)
-        elif args.type == "coils":
-            rr = client.read_coils(args.address, count=args.count, device_id=args.unit)
-        else:  # discrete
-            rr = client.read_discrete_inputs(args.address, count=args.count, device_id=args.unit)
-
-        if rr.isError():
-            print(f"Modbus error: {rr}", file=sys.stderr)
-            return 4
+        latencies = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            responses = await asyncio.gather(*(read(client, args) for _ in range(args.concurrent)))
+            latencies.append(time.perf_counter() - t0)
+            for rr in responses:
+                if rr.isError():
+                    print(f"Modbus error: {rr}", file=sys.stderr)
+                    return 4
+        rr = responses[-1]
 
         if args.type in {"holding", "input"}:
             values = getattr(rr, "registers", None)
@@ -110,6 +140,16 @@ def main() -> int:
                 "values": values,
             }
         )
+        if args.repeat > 1 or args.concurrent > 1:
+            print(
+                {
+                    "batches": args.repeat,
+                    "reads_per_batch": args.concurrent,
+                    "batch_ms_min": round(min(latencies) * 1000, 3),
+                    "batch_ms_max": round(max(latencies) * 1000, 3),
+                    "batch_ms_mean": round(statistics.fmean(latencies) * 1000, 3),
+                }
+            )
         return 0
     finally:
         try:
@@ -118,5 +158,20 @@ def main() -> int:
             pass
 
 
+def main() -> int:
+    args = parse_args()
+    if not args.no_uvloop:
+        try:
+            import uvloop  # type: ignore
+        except ImportError:
+            pass
+        else:
+            if hasattr(uvloop, "run"):
+                return uvloop.run(run(args))
+            # uvloop < 0.18 has no run(); install its policy for asyncio.run instead
+            uvloop.install()
+    return asyncio.run(run(args))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())